@@ -5,16 +5,28 @@ LinkedIn Jobs scraper (handles 'Sign in to view more jobs' modal)
 - Selenium Manager (no driver path)
 - Robust selectors + explicit waits
 - Detects + clears 'Sign in to view more jobs' overlay by re-authing
-- Parameterized search; CSV includes job_description
+- Session cookies cached on disk so later runs skip the login form
+- Parameterized search; several queries collected in parallel browsers
+- CSV includes job_description
+- Job details fetched concurrently from the public guest endpoint (aiohttp)
 """
 
 from __future__ import annotations
 
 import os
+import re
+import csv
+import json
 import time
+import asyncio
+import random
 import argparse
 import logging
-from typing import Optional, Dict, List
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping, Optional, Dict, List
+from urllib.parse import urlencode, quote_plus, urlparse
 
 # Optional .env for dev
 try:
@@ -23,7 +35,8 @@ try:
 except Exception:
     pass
 
-import pandas as pd
+import aiohttp
+from lxml import html as lxml_html
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -33,21 +46,49 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
 
 # ----------------------------- CLI / Config ----------------------------- #
 
+Query = tuple[str, str, Optional[str]]  # (keywords, location, geoId)
+
+def parse_query(value: str) -> Query:
+    parts = [x.strip() for x in value.split("|")]
+    if len(parts) not in (2, 3) or not parts[0]:
+        raise argparse.ArgumentTypeError("expected 'keywords|location[|geoId]'")
+    return parts[0], parts[1], (parts[2] if len(parts) == 3 and parts[2] else None)
+
 def get_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Scrape LinkedIn job postings.")
     p.add_argument("--keywords", default="junior data analyst")
     p.add_argument("--location", default="Spain")
     p.add_argument("--geoId", default="105646813")
+    p.add_argument("--query", type=parse_query, action="append", default=[],
+                   help="'keywords|location[|geoId]'; repeat to run several searches "
+                        "(overrides --keywords/--location/--geoId).")
     p.add_argument("--pages", type=int, default=13)
+    p.add_argument("--workers", type=int, default=4,
+                   help="Parallel Chrome instances for link collection, one query each.")
     p.add_argument("--headless", action="store_true")
     p.add_argument("--out", default="job_offers.csv")
+    p.add_argument("--cookies", default=".li_cookies.json",
+                   help="Session cookie cache; reused to skip login.")
+    p.add_argument("--concurrency", type=int, default=8,
+                   help="Max in-flight job detail requests.")
+    p.add_argument("--rate", type=float, default=2.0,
+                   help="Steady-state job detail requests per second, per host/proxy.")
+    p.add_argument("--proxy", action="append", default=[],
+                   help="HTTP proxy for job detail requests; repeat to rotate.")
+    p.add_argument("--browser-details", action="store_true",
+                   help="Scrape job pages through Chrome instead of the guest API.")
+    p.add_argument("--tabs", type=int, default=4,
+                   help="Tabs loading job pages at once with --browser-details.")
     return p.parse_args()
 
+def configure_logging() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
+
 def get_credentials() -> tuple[str, str]:
     u, pw = os.getenv("LINKEDIN_USER"), os.getenv("LINKEDIN_PASS")
     if not u or not pw:
@@ -55,7 +96,6 @@ def get_credentials() -> tuple[str, str]:
     return u, pw
 
 def build_search_url(keywords: str, location: str, geo_id: Optional[str]) -> str:
-    from urllib.parse import urlencode, quote_plus
     base = "https://www.linkedin.com/jobs/search/"
     params = {"keywords": keywords, "location": location}
     if geo_id: params["geoId"] = geo_id
@@ -64,8 +104,19 @@ def build_search_url(keywords: str, location: str, geo_id: Optional[str]) -> str
 
 # ----------------------------- Browser ---------------------------------- #
 
-def make_driver(headless: bool = False) -> webdriver.Chrome:
+# Nothing we scrape needs these; blocked at the network layer via CDP.
+# Stylesheets and LinkedIn's own script bundles are left alone: the search
+# page is a JS app and visibility-based waits depend on computed styles.
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+    "*px.ads.linkedin.com*", "*snap.licdn.com*",
+]
+
+def make_driver(headless: bool = False, page_load_strategy: str = "normal") -> webdriver.Chrome:
     options = Options()
+    options.page_load_strategy = page_load_strategy
     if headless:
         options.add_argument("--headless=new")
     options.add_argument("--window-size=1280,1200")
@@ -78,16 +129,26 @@ def make_driver(headless: bool = False) -> webdriver.Chrome:
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
     options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
 
     service = Service()
     driver = webdriver.Chrome(service=service, options=options)
+    _setup_target(driver)
+    return driver
+
+def _setup_target(driver: webdriver.Chrome) -> None:
+    # CDP state is per target: call again for every tab/window we open
     try:
         driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
             "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         })
     except Exception:
         pass
-    return driver
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    except Exception:
+        logging.warning("Could not enable resource blocking; continuing without it.")
 
 
 # ----------------------------- Utils ------------------------------------ #
@@ -101,46 +162,102 @@ def try_click(driver: webdriver.Chrome, wait: WebDriverWait, by: By, sel: str, t
     except Exception:
         return False
 
-def first_text(scope: webdriver.Chrome | WebElement, selectors: List[tuple[By, str]], timeout: int = 6) -> Optional[str]:
-    for by, sel in selectors:
-        try:
-            elem = WebDriverWait(scope, timeout).until(EC.presence_of_element_located((by, sel)))
-            txt = elem.text.strip()
-            if txt: return txt
-        except Exception:
-            continue
-    return None
-
 
 # ----------------------------- Auth ------------------------------------- #
 
+COOKIE_SELECTORS = (
+    (By.XPATH, "//button[.//span[contains(., 'Accept') or contains(., 'Agree')]]"),
+    (By.XPATH, "//button[contains(., 'Accept')]"),
+    (By.XPATH, "//button[contains(., 'I agree')]"),
+    (By.CSS_SELECTOR, "button[aria-label*='cookie']"),
+    (By.CSS_SELECTOR, "button[aria-label*='Cookie']"),
+    (By.CSS_SELECTOR, "button[title*='Accept']"),
+)
+
 def login(driver: webdriver.Chrome, wait: WebDriverWait, user: str, pwd: str) -> None:
     driver.get("https://www.linkedin.com/login")
-    # Best-effort cookie/consent dismissal (varies by region)
-    for sel in [
-        "//button[.//span[contains(., 'Accept') or contains(., 'Agree')]]",
-        "//button[contains(., 'Accept')]",
-        "//button[contains(., 'I agree')]",
-        "button[aria-label*='cookie']",
-        "button[aria-label*='Cookie']",
-        "button[title*='Accept']",
-    ]:
-        if try_click(driver, wait, By.XPATH, sel, 2) or try_click(driver, wait, By.CSS_SELECTOR, sel, 2):
-            break
+    # Best-effort cookie/consent dismissal (varies by region). The banner is
+    # rendered with the page if at all, so no waiting: one lookup per selector.
+    for by, sel in COOKIE_SELECTORS:
+        els = driver.find_elements(by, sel)
+        if els:
+            try:
+                els[0].click()
+                break
+            except Exception:
+                pass
     wait.until(EC.visibility_of_element_located((By.ID, "username"))).send_keys(user)
     wait.until(EC.visibility_of_element_located((By.ID, "password"))).send_keys(pwd)
     try_click(driver, wait, By.XPATH, "//button[@type='submit']", 10)
 
-def is_authwall_modal(driver: webdriver.Chrome) -> bool:
-    # Look for the specific modal text or generic artdeco modal
+def save_cookies(driver: webdriver.Chrome, path: str) -> None:
+    # Write-then-rename so readers never see a half-written cache. The file
+    # holds the li_at session token: owner-only permissions from the start.
+    tmp = f"{path}.{os.getpid()}.tmp"
     try:
-        h = driver.find_elements(By.XPATH, "//h2[contains(., 'Sign in to view more jobs')]")
-        if h: return True
-    except Exception:
-        pass
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump(driver.get_cookies(), f)
+        os.replace(tmp, path)
+    except Exception as e:
+        logging.warning("Could not save cookies to %s: %s", path, e)
+
+def _read_cookies(path: str) -> List[Dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+def load_cookies(driver: webdriver.Chrome, path: str) -> bool:
+    """Replay cached cookies into the browser. Returns False if none were loaded."""
+    cookies = _read_cookies(path)
+    if not cookies:
+        return False
+    # Cookies can only be added for the domain currently loaded
+    driver.get("https://www.linkedin.com/")
+    loaded = 0
+    for c in cookies:
+        try:
+            driver.add_cookie(c)
+            loaded += 1
+        except Exception:
+            continue
+    return loaded > 0
+
+def load_cookies_cdp(driver: webdriver.Chrome, path: str) -> bool:
+    """
+    Like load_cookies, but through CDP, which needs no page loaded first.
+    For drivers with page_load_strategy="none", where driver.get returns
+    before the linkedin.com document that add_cookie requires exists.
+    """
+    cookies = [
+        {k: v for k, v in {**c, "expires": c.get("expiry")}.items() if k != "expiry" and v is not None}
+        for c in _read_cookies(path)
+    ]
+    if not cookies:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+    except Exception as e:
+        logging.warning("Could not replay cookies via CDP: %s", e)
+        return False
+    return True
+
+def ensure_logged_in(driver: webdriver.Chrome) -> bool:
+    # Logged-out sessions get redirected from the feed to /login or /authwall
+    driver.get("https://www.linkedin.com/feed/")
+    return urlparse(driver.current_url).path.startswith("/feed")
+
+AUTHWALL_JS = """
+return !!(document.querySelector('.artdeco-modal, .sign-in-modal') ||
+  [...document.querySelectorAll('h2')].some(h => h.textContent.includes('Sign in to view more jobs')));
+"""
+
+def is_authwall_modal(driver: webdriver.Chrome) -> bool:
+    # Generic artdeco modal or the specific heading, checked in one round trip
     try:
-        modals = driver.find_elements(By.CSS_SELECTOR, ".artdeco-modal, .sign-in-modal")
-        return len(modals) > 0
+        return bool(driver.execute_script(AUTHWALL_JS))
     except Exception:
         return False
 
@@ -160,7 +277,10 @@ def clear_signin_overlay_or_reauth(driver: webdriver.Chrome, wait: WebDriverWait
     # Try close (X) first
     for sel in ["button[aria-label='Dismiss']", "button[aria-label='Close']", ".artdeco-modal__dismiss"]:
         if try_click(driver, wait, By.CSS_SELECTOR, sel, 2):
-            time.sleep(0.5)
+            try:
+                WebDriverWait(driver, 5).until(EC.invisibility_of_element_located((By.CSS_SELECTOR, ".artdeco-modal")))
+            except TimeoutException:
+                pass
             if not is_authwall_modal(driver):
                 return
 
@@ -174,7 +294,7 @@ def clear_signin_overlay_or_reauth(driver: webdriver.Chrome, wait: WebDriverWait
         # Complete login then return to search
         login(driver, wait, user, pwd)
         driver.get(search_url)
-        time.sleep(1.0)
+        wait_for_search_page(driver)
         # Recheck once
         if attempts > 0 and is_authwall_modal(driver):
             clear_signin_overlay_or_reauth(driver, wait, search_url, user, pwd, attempts - 1)
@@ -186,47 +306,100 @@ def clear_signin_overlay_or_reauth(driver: webdriver.Chrome, wait: WebDriverWait
             pass
 
 
+def open_authenticated(driver: webdriver.Chrome, wait: WebDriverWait, url: str,
+                       cookies_path: str, user: str, pwd: str, allow_login: bool = True) -> None:
+    """
+    Open url with a logged-in session, reusing cached cookies when they still
+    work. With allow_login=False only the cache is tried; the login form is
+    never submitted. Raises RuntimeError if we still end up logged out.
+    """
+    if load_cookies(driver, cookies_path) and ensure_logged_in(driver):
+        logging.info("Reusing cached session.")
+    elif allow_login:
+        login(driver, wait, user, pwd)
+    else:
+        raise RuntimeError(f"No valid cached session in {cookies_path}.")
+    driver.get(url)
+    wait_for_search_page(driver)
+    logging.info("Opened search: %s", url)
+
+    # Handle the sign-in overlay if it appears (may re-login)
+    if allow_login:
+        clear_signin_overlay_or_reauth(driver, wait, url, user, pwd)
+
+    # Checkpoint, bad credentials, or an overlay we could not clear
+    path = urlparse(driver.current_url).path
+    if any(p in path for p in ("/login", "/checkpoint", "/authwall")) or is_authwall_modal(driver):
+        raise RuntimeError(f"LinkedIn authentication failed (at {driver.current_url}).")
+
+
 # ----------------------------- Results ---------------------------------- #
 
+HARVEST_JS = """
+const set = new Set();
+arguments[0].querySelectorAll(
+  "a[href*='/jobs/view/'], li a[data-job-id], a.job-card-container__link"
+).forEach(a => {
+  // origin + pathname drops ?query and #fragment without string splitting
+  const h = a.href ? a.origin + a.pathname : "";
+  if (h.startsWith("https://www.linkedin.com/jobs/view")) set.add(h);
+});
+return [...set];
+"""
+
+RESULTS_CONTAINER_SELECTORS = (
+    "ul.jobs-search__results-list",
+    ".jobs-search-results__list",
+    "div.jobs-search-two-pane__results-list",
+    "[data-test-reusables-search__results-list]",
+    "[data-test-search-results] ul",
+)
+RESULTS_CONTAINER_ANY = ", ".join(RESULTS_CONTAINER_SELECTORS)
+
+def wait_for_search_page(driver: webdriver.Chrome, timeout: int = 10) -> None:
+    # Returns as soon as either the results list or a sign-in overlay is rendered
+    ready = f"{RESULTS_CONTAINER_ANY}, .artdeco-modal, .sign-in-modal"
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, ready)))
+    except TimeoutException:
+        logging.warning("Search page not ready after %ds: %s", timeout, driver.current_url)
+
 def _find_results_container(driver: webdriver.Chrome, wait: WebDriverWait) -> Optional[WebElement]:
-    candidates = [
-        "ul.jobs-search__results-list",
-        ".jobs-search-results__list",
-        "div.jobs-search-two-pane__results-list",
-        "[data-test-reusables-search__results-list]",
-        "[data-test-search-results] ul",
-    ]
-    for sel in candidates:
-        try:
-            return WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, sel)))
-        except TimeoutException:
-            continue
+    try:
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, RESULTS_CONTAINER_ANY)))
+    except TimeoutException:
+        return None
+    for sel in RESULTS_CONTAINER_SELECTORS:
+        found = driver.find_elements(By.CSS_SELECTOR, sel)
+        if found: return found[0]
     return None
 
 def collect_links(driver: webdriver.Chrome, wait: WebDriverWait, pages: int) -> List[str]:
     links: set[str] = set()
 
-    def harvest() -> None:
+    def harvest() -> WebElement:
         container = _find_results_container(driver, wait)
         if not container:
             snippet = (driver.page_source or "")[:1500].replace("\n", " ")
             logging.error("No results list. URL=%s | Snippet=%s", driver.current_url, snippet)
             raise TimeoutException("Jobs results container not found.")
-        anchors = []
-        anchors += container.find_elements(By.CSS_SELECTOR, "a[href*='/jobs/view/']")
-        anchors += container.find_elements(By.CSS_SELECTOR, "li a[data-job-id]")
-        anchors += container.find_elements(By.CSS_SELECTOR, "a.job-card-container__link")
-        for a in anchors:
-            href = (a.get_attribute("href") or "").strip()
-            if href.startswith("https://www.linkedin.com/jobs/view"):
-                links.add(href.split("?")[0])
+        # One round trip: collect + dedupe hrefs in-page
+        hrefs = driver.execute_script(HARVEST_JS, container) or []
+        links.update(hrefs)
+        return container
 
     # Page 1
-    harvest()
+    container = harvest()
     logging.info("Collected %d links on page 1", len(links))
 
     # Page 2..N
     for page in range(2, max(2, pages + 1)):
+        # Any card from the current page goes stale once the next page renders;
+        # fetch just the first one rather than a reference to every card
+        try:
+            old_card: Optional[WebElement] = container.find_element(By.CSS_SELECTOR, "li")
+        except NoSuchElementException:
+            old_card = None
         clicked = False
         for sel in [
             f"button[aria-label='Page {page}']",
@@ -243,49 +416,138 @@ def collect_links(driver: webdriver.Chrome, wait: WebDriverWait, pages: int) ->
         if not clicked:
             logging.warning("Could not navigate to page %d; stopping pagination.", page)
             break
-        time.sleep(1.2)
-        harvest()
+        if old_card is not None:
+            try:
+                WebDriverWait(driver, 10).until(EC.staleness_of(old_card))
+            except TimeoutException:
+                logging.warning("Page %d results did not refresh in time.", page)
+        container = harvest()
         logging.info("Collected %d total links after page %d", len(links), page)
 
     return list(links)
 
+def collect_links_for_query(query: Query, pages: int, headless: bool, cookies_path: str,
+                            allow_login: bool = True) -> List[str]:
+    """
+    One fresh browser per query, closed when done. Pool workers run with
+    allow_login=False: they only replay the cache the parent wrote.
+    """
+    user, pwd = get_credentials()
+    search_url = build_search_url(*query)
+
+    driver = make_driver(headless=headless)
+    wait = WebDriverWait(driver, 20)
+    try:
+        open_authenticated(driver, wait, search_url, cookies_path, user, pwd, allow_login)
+        if allow_login:
+            save_cookies(driver, cookies_path)  # only a session that actually worked
+        return collect_links(driver, wait, pages=pages)
+    finally:
+        driver.quit()
+
+def prime_session(url: str, headless: bool, cookies_path: str) -> None:
+    """Authenticate once and write the cookie cache before queries fan out."""
+    user, pwd = get_credentials()
+    driver = make_driver(headless=headless)
+    wait = WebDriverWait(driver, 20)
+    try:
+        open_authenticated(driver, wait, url, cookies_path, user, pwd)
+        save_cookies(driver, cookies_path)
+    finally:
+        driver.quit()
+
+def collect_all_links(queries: List[Query], pages: int, headless: bool,
+                      cookies_path: str, workers: int) -> List[str]:
+    """
+    Run every query, in worker processes when possible. Authentication
+    failures raise on every path; with several queries, a query that fails
+    after that is logged and skipped.
+    """
+    links: set[str] = set()
+
+    def merge(q: Query, result: Callable[[], List[str]]) -> None:
+        try:
+            found = result()
+        except Exception as e:
+            logging.error("Query %s failed: %s", q, e)
+            return
+        links.update(found)
+        logging.info("Query %s: %d links (%d unique so far)", q, len(found), len(links))
+
+    if len(queries) == 1:
+        # Logs in itself (the equivalent of prime_session below); nothing to skip to
+        return collect_links_for_query(queries[0], pages, headless, cookies_path)
+
+    # Several browsers submitting the login form at once looks like an attack
+    # to LinkedIn; log in here once and let every query replay the cache.
+    prime_session(build_search_url(*queries[0]), headless, cookies_path)
+
+    if workers <= 1:
+        for q in queries:
+            merge(q, lambda q=q: collect_links_for_query(q, pages, headless, cookies_path, False))
+        return list(links)
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(queries)), initializer=configure_logging) as pool:
+        futures = {pool.submit(collect_links_for_query, q, pages, headless, cookies_path, False): q
+                   for q in queries}
+        for fut in as_completed(futures):
+            merge(futures[fut], fut.result)
+    return list(links)
+
 
 # ----------------------------- Job page --------------------------------- #
 
-def scrape_job(driver: webdriver.Chrome, wait: WebDriverWait, url: str) -> Optional[Dict[str, Optional[str]]]:
+# CSV column -> (scope, CSS fallbacks in priority order); scope "top" is the unified top card
+JOB_FIELDS = {
+    "job_title": ("top", ["h1", ".jobs-unified-top-card__job-title"]),
+    "company_name": ("top", ["a.jobs-unified-top-card__company-name", ".jobs-unified-top-card__company-name"]),
+    "company_location": ("top", [".jobs-unified-top-card__bullet", "[data-test-topcard-location]"]),
+    "work_method": ("top", [".jobs-unified-top-card__workplace-type"]),
+    "post_date": ("top", [".jobs-unified-top-card__posted-date", "[data-test-posted-date]"]),
+    "work_time": ("top", [".jobs-unified-top-card__job-insight"]),
+    "job_description": ("page", [".jobs-description__content .jobs-box__html-content"]),
+}
+
+# Reads every field in one round trip instead of one call per element
+JOB_FIELDS_JS = """
+const [top, fields] = arguments;
+const q = (root, sels) => {
+  for (const s of sels) {
+    for (const el of root.querySelectorAll(s)) {
+      const t = (el.innerText || "").trim();
+      if (t) return t;
+    }
+  }
+  return null;
+};
+const out = {};
+for (const [key, [scope, sels]] of Object.entries(fields)) {
+  out[key] = q(scope === "top" ? top : document, sels);
+}
+return out;
+"""
+
+def extract_job(driver: webdriver.Chrome, wait: WebDriverWait, url: str) -> Optional[Dict[str, Optional[str]]]:
+    """Scrape the job page loading (or loaded) in the current tab."""
     try:
-        driver.get(url)
+        # Navigation may still be in flight; don't read the tab's previous job.
+        # Match the path only (/authwall?sessionRedirect=... carries the id too),
+        # and wait on readyState in place of the load wait driver.get would do.
+        jid = job_id(url)
+        WebDriverWait(driver, 15).until(
+            lambda d: job_id(urlparse(d.current_url).path) == jid
+            and d.execute_script("return document.readyState") == "complete"
+        )
         try_click(driver, wait, By.CSS_SELECTOR, ".show-more-less-html__button", 4)
         try_click(driver, wait, By.CSS_SELECTOR, ".artdeco-card__actions button", 3)
 
         top = WebDriverWait(driver, 8).until(EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-unified-top-card")))
 
-        title = first_text(top, [(By.CSS_SELECTOR, "h1"), (By.CSS_SELECTOR, ".jobs-unified-top-card__job-title")])
-        company = first_text(top, [(By.CSS_SELECTOR, "a.jobs-unified-top-card__company-name"),
-                                   (By.CSS_SELECTOR, ".jobs-unified-top-card__company-name")])
-        location = first_text(top, [(By.CSS_SELECTOR, ".jobs-unified-top-card__bullet"),
-                                    (By.CSS_SELECTOR, "[data-test-topcard-location]")])
-        workplace = first_text(top, [(By.CSS_SELECTOR, ".jobs-unified-top-card__workplace-type")])
-        posted = first_text(top, [(By.CSS_SELECTOR, ".jobs-unified-top-card__posted-date"),
-                                  (By.CSS_SELECTOR, "[data-test-posted-date]")])
-        schedule = first_text(top, [(By.CSS_SELECTOR, ".jobs-unified-top-card__job-insight")])
-
-        desc_container = driver.find_elements(By.CSS_SELECTOR, ".jobs-description__content .jobs-box__html-content")
-        description = desc_container[0].text.strip() if desc_container else None
-
-        if not title and not description:
+        data = driver.execute_script(JOB_FIELDS_JS, top, JOB_FIELDS) or {}
+        if not data.get("job_title") and not data.get("job_description"):
             return None
 
-        return {
-            "job_title": title,
-            "company_name": company,
-            "company_location": location,
-            "work_method": workplace,
-            "post_date": posted,
-            "work_time": schedule,
-            "job_description": description,
-            "url": url,
-        }
+        return {**data, "url": url}
     except TimeoutException:
         logging.warning("Timeout while scraping %s", url)
         return None
@@ -293,50 +555,315 @@ def scrape_job(driver: webdriver.Chrome, wait: WebDriverWait, url: str) -> Optio
         logging.exception("Error scraping %s: %s", url, e)
         return None
 
+def scrape_jobs_in_tabs(driver: webdriver.Chrome, wait: WebDriverWait, links: List[str],
+                        on_record: Callable[[Dict[str, Optional[str]]], None], tabs: int = 4) -> int:
+    """
+    Rolling pool of browser tabs: each tab starts loading its next job as soon
+    as the current one is parsed, so page loads overlap with extraction.
+    """
+    handles = [driver.current_window_handle]
+    for _ in range(max(1, tabs) - 1):
+        driver.switch_to.new_window("tab")
+        _setup_target(driver)
+        handles.append(driver.current_window_handle)
+
+    def start(handle: str, url: str) -> None:
+        # With page_load_strategy="none" this returns without waiting for the load
+        driver.switch_to.window(handle)
+        driver.execute_script("window.location.href = arguments[0];", url)
+
+    pending = iter(links)
+    queue: deque[tuple[str, str]] = deque()
+    for h, url in zip(handles, pending):
+        start(h, url)
+        queue.append((h, url))
+
+    done = scraped = 0
+    try:
+        while queue:
+            h, url = queue.popleft()
+            driver.switch_to.window(h)
+            rec = extract_job(driver, wait, url)
+            if rec:
+                on_record(rec)
+                scraped += 1
+            done += 1
+            if done % 10 == 0:
+                logging.info("Scraped %d/%d jobs…", done, len(links))
+            time.sleep(0.6)
+            nxt = next(pending, None)
+            if nxt:
+                start(h, nxt)
+                queue.append((h, nxt))
+    finally:
+        for h in handles[1:]:
+            driver.switch_to.window(h)
+            driver.close()
+        driver.switch_to.window(handles[0])
+    return scraped
+
+
+# ----------------------------- Guest API -------------------------------- #
+
+GUEST_HOST = "www.linkedin.com"
+GUEST_JOB_URL = f"https://{GUEST_HOST}/jobs-guest/jobs/api/jobPosting/{{}}"
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 1.0  # seconds; doubled on every throttled attempt
+GUEST_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:127.0) Gecko/20100101 Firefox/127.0",
+]
+
+# /jobs/view/1234567890/ or /jobs/view/some-title-at-company-1234567890
+_JID_RE = re.compile(r"/jobs/view/(?:[^/?]*-)?(\d+)")
+
+def job_id(url: str) -> Optional[str]:
+    m = _JID_RE.search(url)
+    return m.group(1) if m else None
+
+def order_links(links: List[str]) -> List[str]:
+    """One URL per job id, sorted by id so requests stay on warm connections/caches."""
+    by_id: Dict[int, str] = {}
+    for url in links:
+        jid = job_id(url)
+        if jid:
+            by_id.setdefault(int(jid), url)
+    if len(by_id) < len(links):
+        logging.info("Dropped %d duplicate or id-less links", len(links) - len(by_id))
+    return [by_id[k] for k in sorted(by_id)]
+
+def _xtext(doc: lxml_html.HtmlElement, xpath: str) -> Optional[str]:
+    for el in doc.xpath(xpath):
+        txt = " ".join(el.text_content().split())
+        if txt: return txt
+    return None
 
-# ----------------------------- Main ------------------------------------- #
-
-def main() -> None:
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
+_BLOCK_TAGS = {"p", "div", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6", "tr"}
+
+def _block_text(el: lxml_html.HtmlElement) -> str:
+    # Like innerText: keep <br> and block boundaries as line breaks
+    for node in el.iter("br", *_BLOCK_TAGS):
+        if node.tag != "br":
+            node.text = "\n" + (node.text or "")
+        node.tail = "\n" + (node.tail or "")
+    lines = (" ".join(line.split()) for line in el.text_content().splitlines())
+    return "\n".join(line for line in lines if line)
+
+def parse_guest_job(page: str, url: str) -> Optional[Dict[str, Optional[str]]]:
+    doc = lxml_html.fromstring(page)
+    title = _xtext(doc, ".//h2[contains(@class,'top-card-layout__title')]")
+    sub = ".//*[contains(@class,'top-card-layout__second-subline')]"
+    company = _xtext(doc, f"{sub}//a[contains(@class,'topcard__org-name-link')]") \
+        or _xtext(doc, f"{sub}//*[contains(concat(' ',normalize-space(@class),' '),' topcard__flavor ')]"
+                       "[not(contains(@class,'topcard__flavor--bullet'))]")
+    location = _xtext(doc, f"{sub}//*[contains(@class,'topcard__flavor--bullet')]")
+    posted = _xtext(doc, f"{sub}//*[contains(@class,'posted-time-ago__text')]")
+    schedule = _xtext(doc, ".//li[contains(@class,'description__job-criteria-item')]"
+                           "[contains(., 'Employment type')]/span")
+
+    desc = doc.xpath(".//div[contains(@class,'description__text')]"
+                     "//div[contains(@class,'show-more-less-html__markup')]") \
+        or doc.xpath(".//div[contains(@class,'description__text')]")
+    description = _block_text(desc[0]) if desc else None
+
+    if not title and not description:
+        return None
 
-    args = get_args()
-    user, pwd = get_credentials()
-    search_url = build_search_url(args.keywords, args.location, args.geoId)
+    return {
+        "job_title": title,
+        "company_name": company,
+        "company_location": location,
+        "work_method": None,  # not exposed by the guest view
+        "post_date": posted,
+        "work_time": schedule,
+        "job_description": description,
+        "url": url,
+    }
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    # Either delta-seconds or an HTTP date
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
 
-    driver = make_driver(headless=args.headless)
-    wait = WebDriverWait(driver, 20)
+class RateLimiter:
+    """
+    Token bucket per key (host, or proxy when rotating). Refills at `rate`
+    tokens/s up to `burst`; response headers can drain a bucket early
+    (X-RateLimit-Remaining) or pause the key outright (Retry-After).
+    """
 
-    records: List[Dict[str, Optional[str]]] = []
+    def __init__(self, rate: float, burst: int):
+        self.rate, self.burst = rate, burst
+        self._tokens: defaultdict[str, float] = defaultdict(lambda: float(burst))
+        self._stamp: Dict[str, float] = {}
+        self._paused_until: defaultdict[str, float] = defaultdict(float)
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, key: str) -> None:
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                delay = self._paused_until[key] - now
+                if delay <= 0:
+                    self._refill(key, now)
+                    if self._tokens[key] >= 1:
+                        self._tokens[key] -= 1
+                        return
+                    delay = (1 - self._tokens[key]) / self.rate
+            await asyncio.sleep(delay)
+
+    def _refill(self, key: str, now: float) -> None:
+        elapsed = now - self._stamp.get(key, now)
+        self._tokens[key] = min(self.burst, self._tokens[key] + elapsed * self.rate)
+        self._stamp[key] = now
+
+    def pause(self, key: str, seconds: float) -> None:
+        self._paused_until[key] = max(self._paused_until[key], time.monotonic() + seconds)
+
+    def update(self, key: str, headers: Mapping[str, str]) -> Optional[float]:
+        """Apply rate-limit headers; returns the server's Retry-After, if any."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.strip().isdigit():
+            # Bring the bucket up to date first, else the next acquire credits
+            # time from before the server's count and refills past it
+            self._refill(key, time.monotonic())
+            self._tokens[key] = min(self._tokens[key], float(remaining))
+        retry = _retry_after(headers.get("Retry-After"))
+        if retry is not None:
+            self.pause(key, retry)
+        return retry
+
+async def fetch_job(session: aiohttp.ClientSession, sem: asyncio.Semaphore, limiter: RateLimiter,
+                    jid: str, url: str, proxy: Optional[str] = None) -> Optional[Dict[str, Optional[str]]]:
+    headers = {**GUEST_HEADERS, "User-Agent": random.choice(USER_AGENTS)}
+    key = proxy or GUEST_HOST  # limits apply per egress address
+    page: Optional[str] = None
     try:
-        # Ensure we are authenticated
-        login(driver, wait, user, pwd)
+        for attempt in range(MAX_ATTEMPTS):
+            await limiter.acquire(key)
+            async with sem, session.get(GUEST_JOB_URL.format(jid), headers=headers, proxy=proxy) as resp:
+                retry = limiter.update(key, resp.headers)
+                if resp.status == 200:
+                    page = await resp.text()
+                    break
+                if resp.status not in (429, 503):
+                    logging.warning("HTTP %d for job %s", resp.status, jid)
+                    return None
+            if attempt == MAX_ATTEMPTS - 1:
+                # No retry left: only a server-sent Retry-After (applied by update) pauses the key
+                break
+            # Throttled: back the whole key off, not just this request
+            delay = retry if retry is not None else BACKOFF_BASE * 2 ** attempt + random.random()
+            limiter.pause(key, delay)
+            logging.info("HTTP %d for job %s; retrying in %.1fs", resp.status, jid, delay)
+        if page is None:
+            logging.warning("Giving up on job %s after %d attempts", jid, MAX_ATTEMPTS)
+            return None
+        return parse_guest_job(page, url)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logging.warning("Request failed for job %s: %s", jid, e)
+        return None
+    except Exception as e:
+        logging.exception("Error parsing job %s: %s", jid, e)
+        return None
 
-        # Go to search and handle the sign-in overlay if it appears
-        driver.get(search_url)
-        logging.info("Opened search: %s", search_url)
-        time.sleep(1.0)
-        clear_signin_overlay_or_reauth(driver, wait, search_url, user, pwd)
+async def fetch_jobs(links: List[str], on_record: Callable[[Dict[str, Optional[str]]], None],
+                     concurrency: int = 8, rate: float = 2.0, proxies: Optional[List[str]] = None) -> int:
+    """
+    Fetch all jobs anonymously, handing each parsed record to on_record as it
+    completes. Requests are spread round-robin over proxies when given.
+    """
+    ids = [(jid, url) for url in links if (jid := job_id(url))]
+
+    sem = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate, burst=concurrency)
+    connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+    timeout = aiohttp.ClientTimeout(total=30)
+    # Guest endpoint needs no session; don't let Set-Cookie tie requests together
+    jar = aiohttp.DummyCookieJar()
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, cookie_jar=jar) as session:
+        tasks = [
+            asyncio.ensure_future(fetch_job(session, sem, limiter, jid, url, proxies[i % len(proxies)] if proxies else None))
+            for i, (jid, url) in enumerate(ids)
+        ]
+        done = 0
+        for fut in asyncio.as_completed(tasks):
+            rec = await fut
+            if rec:
+                on_record(rec)
+                done += 1
+    return done
 
-        # Now collect links
-        links = collect_links(driver, wait, pages=args.pages)
-        logging.info("Found %d unique job links", len(links))
 
-        for idx, link in enumerate(links, start=1):
-            rec = scrape_job(driver, wait, link)
-            if rec:
-                records.append(rec)
-            time.sleep(0.6)
-            if idx % 10 == 0:
-                logging.info("Scraped %d/%d jobs…", idx, len(links))
+# ----------------------------- Main ------------------------------------- #
+
+FIELDNAMES = [
+    "job_title", "company_name", "company_location", "work_method",
+    "post_date", "work_time", "job_description", "url",
+]
 
-        if records:
-            pd.DataFrame(records).to_csv(args.out, index=False)
-            logging.info("Wrote %d rows to %s", len(records), args.out)
+def main() -> None:
+    configure_logging()
+
+    args = get_args()
+    get_credentials()  # fail fast, before any browser starts
+    queries = args.query or [(args.keywords, args.location, args.geoId)]
+
+    links = order_links(collect_all_links(queries, args.pages, args.headless, args.cookies, args.workers))
+    logging.info("Found %d unique job links", len(links))
+    if not links:
+        # Don't truncate a previous run's CSV for nothing
+        logging.error("No job links collected; leaving %s untouched.", args.out)
+        raise SystemExit(1)
+
+    # Rows are streamed to disk so a late crash keeps everything scraped so far
+    with open(args.out, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        written = 0
+
+        def emit(rec: Dict[str, Optional[str]]) -> None:
+            nonlocal written
+            writer.writerow(rec)
+            f.flush()
+            written += 1
+
+        if args.browser_details:
+            # collect_all_links only returns after a successful login wrote the
+            # cookie cache; replay it into a page_load_strategy="none" driver so
+            # the tabs load concurrently.
+            driver = make_driver(headless=args.headless, page_load_strategy="none")
+            wait = WebDriverWait(driver, 20)
+            try:
+                if not load_cookies_cdp(driver, args.cookies):
+                    raise RuntimeError(f"No cached session in {args.cookies}.")
+                scrape_jobs_in_tabs(driver, wait, links, emit, tabs=args.tabs)
+            finally:
+                driver.quit()
+                logging.info("Browser closed.")
         else:
-            logging.warning("No records scraped; nothing to write.")
-    finally:
-        driver.quit()
-        logging.info("Browser closed.")
+            # Detail pages are plain network I/O; no browser needed
+            fetched = asyncio.run(fetch_jobs(links, emit, concurrency=args.concurrency,
+                                             rate=args.rate, proxies=args.proxy))
+            logging.info("Fetched %d/%d jobs via guest API", fetched, len(links))
+
+    if written:
+        logging.info("Wrote %d rows to %s", written, args.out)
+    else:
+        logging.warning("No records scraped; %s has only a header.", args.out)
 
 
 if __name__ == "__main__":